@@ -1,29 +1,82 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import importlib.util
 import os
 import re
 import time
 from dataclasses import dataclass, field
-from urllib.parse import urlsplit, urlunsplit
+from html.parser import HTMLParser
+from urllib.parse import SplitResult, urlsplit, urlunsplit
 from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict
 
 import httpx
-from playwright.async_api import Browser, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Error as PlaywrightError,
+    Page,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+)
 
 
-DEFAULT_MAINTENANCE_TEXT = [
+DEFAULT_MAINTENANCE_TEXT = (
     "maintenance",
     "temporarily unavailable",
     "we'll be back",
     "bad gateway",
     "service unavailable",
     "gateway timeout",
-]
+)
+
+_CAPTURE_HEADER_DENY = frozenset({"authorization", "cookie", "set-cookie"})
+_CAPTURE_HEADER_NAME_RE = re.compile(r"[a-z0-9-]{1,80}")
 
 _SCRIPT_AND_STYLE_RE = re.compile(r"(?is)<(script|style)[^>]*>.*?</\1>")
-_HTML_TAG_RE = re.compile(r"(?is)<[^>]+>")
+# No flags: `[^>]` already spans newlines and there is nothing to case-fold, and IGNORECASE slows the scan.
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Selectors for <head> elements never become "visible"; same prefix test as lstrip().startswith(...).
+_HEAD_ELEMENT_SELECTOR_RE = re.compile(r"\s*(?:meta|script|link|title)")
+
+# Upper bound on how much of a response body http_get_check reads and scans.
+HTTP_MAX_BODY_BYTES = 2 * 1024 * 1024
+
+# Heavy subresources the browser check never needs, decided by resource type on every request: a URL
+# extension pattern would miss extensionless image/font endpoints (`/_next/image?url=`, CDN `/image?id=`).
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Page title and visible body text, fetched together after navigation.
+_TITLE_AND_TEXT_JS = "() => [document.title, document.body?.innerText || '']"
+# Drops the page origin's web storage before a pooled context is reused, so a later check cannot be
+# answered from localStorage/IndexedDB/CacheStorage left behind by an earlier one.
+_CLEAR_STORAGE_JS = """async () => {
+  try { localStorage.clear(); } catch (e) {}
+  try { sessionStorage.clear(); } catch (e) {}
+  if (self.indexedDB && indexedDB.databases) {
+    for (const db of await indexedDB.databases()) { if (db.name) indexedDB.deleteDatabase(db.name); }
+  }
+  if (self.caches) {
+    for (const key of await caches.keys()) { await caches.delete(key); }
+  }
+}"""
+
+# Elements whose content is never part of the rendered DOM tree a selector sees: <template> content is
+# inert, <textarea>/<title> hold text, and <noscript> is not rendered for a JS-enabled browser.
+_INERT_CONTENT_TAGS = frozenset({"noscript", "template", "textarea", "title"})
+
+# Compound CSS selectors we can evaluate against raw HTML without a browser:
+# `tag`, `#id`, `.class` and `[attr]`, `[attr=v]`, `[attr^=v]`, `[attr$=v]`, `[attr*=v]`, `[attr~=v]`.
+_STATIC_SELECTOR_TAG_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9-]*")
+# Ids and classes must be CSS identifiers (no leading digit or hyphen-digit); anything else needs the browser.
+_STATIC_SELECTOR_PART_RE = re.compile(
+    r"#((?:--|-?[^\W\d])[\w-]*)"
+    r"|\.((?:--|-?[^\W\d])[\w-]*)"
+    r"|\[\s*([\w:-]+)\s*(?:([\^$*~]?=)\s*(\"[^\"]*\"|'[^']*'|[^\]\s\"']+)\s*)?\]"
+)
 
 
 @dataclass(frozen=True)
@@ -42,7 +95,8 @@ class DomainCheckSpec:
     required_selectors_all: list[SelectorCheck] = field(default_factory=list)
     required_selectors_any: list[SelectorCheck] = field(default_factory=list)
     required_text_all: list[str] = field(default_factory=list)
-    forbidden_text_any: list[str] = field(default_factory=lambda: list(DEFAULT_MAINTENANCE_TEXT))
+    # Only ever scanned, so the shared immutable default is used as-is rather than copied per spec.
+    forbidden_text_any: list[str] | tuple[str, ...] = DEFAULT_MAINTENANCE_TEXT
     # Capture a small allow-listed set of response headers for downstream checks (e.g. upstream/failover markers).
     capture_headers: list[str] = field(default_factory=list)
     # Optional extended checks (used by additional monitoring "metrics" modules).
@@ -52,6 +106,77 @@ class DomainCheckSpec:
     proxy: dict[str, Any] = field(default_factory=dict)
     http_timeout_seconds: float = 15.0
     browser_timeout_seconds: float = 25.0
+    # Derived once per spec so the per-check scans don't re-lowercase/normalize every keyword:
+    # (original, lowercased) pairs for forbidden text and (original, normalized) pairs for required text.
+    # `forbidden_words` is the de-duplicated set of words across all forbidden keywords, so the raw-body
+    # pre-scan searches each shared word ("gateway", "unavailable", ...) once; `forbidden_text_words`
+    # holds each keyword's own words, aligned with `forbidden_text_lc`.
+    forbidden_text_lc: tuple[tuple[str, str], ...] = field(init=False, repr=False, compare=False)
+    forbidden_text_words: tuple[frozenset[str], ...] = field(init=False, repr=False, compare=False)
+    forbidden_words: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # ASCII-encoded `forbidden_words` for scanning undecoded bodies with bytes.find; None if any word is non-ASCII.
+    forbidden_words_bytes: tuple[bytes, ...] | None = field(init=False, repr=False, compare=False)
+    required_text_norm: tuple[tuple[str, str], ...] = field(init=False, repr=False, compare=False)
+    # Lowercased, validated `capture_headers` (first 30, credential headers dropped).
+    capture_header_keys: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # Lowercased title/final-host expectations ("" when unset).
+    expected_title_lc: str = field(init=False, repr=False, compare=False)
+    expected_final_host_suffix_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        forbidden_text_lc = _lowercased_pairs(self.forbidden_text_any)
+        forbidden_words = _unique_words(forbidden_text_lc)
+        object.__setattr__(self, "forbidden_text_lc", forbidden_text_lc)
+        object.__setattr__(self, "forbidden_text_words", _word_sets(forbidden_text_lc))
+        object.__setattr__(self, "forbidden_words", forbidden_words)
+        object.__setattr__(self, "forbidden_words_bytes", _ascii_encoded(forbidden_words))
+        object.__setattr__(self, "required_text_norm", _normalized_pairs(self.required_text_all))
+        object.__setattr__(self, "capture_header_keys", _capture_header_keys(self.capture_headers))
+        object.__setattr__(self, "expected_title_lc", (self.expected_title_contains or "").lower())
+        object.__setattr__(
+            self, "expected_final_host_suffix_lc", (self.expected_final_host_suffix or "").strip().lower()
+        )
+
+
+def _lowercased_pairs(keywords: list[str] | tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    # Every non-empty keyword keeps its own pair, so `forbidden_hits` reports the configured list as-is.
+    present = (kw for kw in keywords if kw)
+    pairs = ((kw, kw.lower()) for kw in present)
+    return tuple(pairs)
+
+
+def _word_sets(pairs: tuple[tuple[str, str], ...]) -> tuple[frozenset[str], ...]:
+    lowered = (kw_lc for _kw, kw_lc in pairs)
+    word_sets = (frozenset(kw_lc.split()) for kw_lc in lowered)
+    return tuple(word_sets)
+
+
+def _unique_words(pairs: tuple[tuple[str, str], ...]) -> tuple[str, ...]:
+    words: dict[str, None] = {}
+    for _kw, kw_lc in pairs:
+        words.update(dict.fromkeys(kw_lc.split()))
+    return tuple(words)
+
+
+def _ascii_encoded(words: tuple[str, ...]) -> tuple[bytes, ...] | None:
+    if not all(w.isascii() for w in words):
+        return None
+    encoded = (w.encode("ascii") for w in words)
+    return tuple(encoded)
+
+
+def _normalized_pairs(texts: list[str]) -> tuple[tuple[str, str], ...]:
+    pairs = ((t, _normalize_text(t)) for t in texts)
+    return tuple(pairs)
+
+
+def _capture_header_keys(names: list[str]) -> tuple[str, ...]:
+    header_keys: dict[str, None] = {}
+    for raw_name in names[:30]:
+        key = str(raw_name or "").strip().lower()
+        if key and key not in _CAPTURE_HEADER_DENY and _CAPTURE_HEADER_NAME_RE.fullmatch(key):
+            header_keys[key] = None
+    return tuple(header_keys)
 
 
 @dataclass(frozen=True)
@@ -63,15 +188,211 @@ class DomainCheckResult:
 
 
 def _normalize_text(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip().lower()
+    # Same as re.sub(r"\s+", " ", s).strip(): str.split() uses the identical Unicode whitespace set, runs
+    # entirely in C and is ~5x faster than the regex on large page bodies.
+    return " ".join(s.split()).lower()
+
+
+def _strip_script_and_style(html: str) -> str:
+    """
+    Same result as `_SCRIPT_AND_STYLE_RE.sub(" ", html)` via linear `str.find` scans: the lazy regex
+    rescans to the end of the body for every unclosed `<script`, which is quadratic on broken pages.
+    """
+    lower = html.lower()
+    if len(lower) != len(html):
+        # Some non-ASCII characters change length when lowercased; offsets would no longer line up.
+        return _SCRIPT_AND_STYLE_RE.sub(" ", html)
+
+    next_open = {"script": lower.find("<script"), "style": lower.find("<style")}
+    pieces: list[str] = []
+    pos = 0
+    while True:
+        open_names = [name for name in next_open if next_open[name] >= 0]
+        if not open_names:
+            break
+        name = min(open_names, key=next_open.__getitem__)
+        start = next_open[name]
+        gt = lower.find(">", start)
+        if gt < 0:
+            break
+        close_tag = f"</{name}>"
+        close = lower.find(close_tag, gt + 1)
+        if close < 0:
+            # Later openings of this tag cannot find a closing tag either.
+            next_open[name] = -1
+            continue
+        pieces.append(html[pos:start])
+        pos = close + len(close_tag)
+        for other, idx in next_open.items():
+            if 0 <= idx < pos:
+                next_open[other] = lower.find(f"<{other}", pos)
+    if not pieces:
+        return html
+    pieces.append(html[pos:])
+    return " ".join(pieces)
 
 
 def _html_to_visible_text(html: str) -> str:
-    without_scripts = _SCRIPT_AND_STYLE_RE.sub(" ", html)
+    without_scripts = _strip_script_and_style(html)
     without_tags = _HTML_TAG_RE.sub(" ", without_scripts)
     return _normalize_text(without_tags)
 
 
+class _TagCollector(HTMLParser):
+    """
+    Collect (tag, attrs) the way the browser's DOM would expose them to a selector: content of
+    `_INERT_CONTENT_TAGS` is skipped (the element itself is kept) and a duplicate attribute keeps its
+    first value.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.elements: list[tuple[str, dict[str, str | None]]] = []
+        self._inert_tag: str | None = None
+        self._inert_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._inert_tag is not None:
+            # Only <template> nests; inside <textarea>/<title> a start tag is plain text.
+            if tag == self._inert_tag == "template":
+                self._inert_depth += 1
+            return
+        first_values: dict[str, str | None] = {}
+        for name, value in attrs:
+            first_values.setdefault(name, value)
+        self.elements.append((tag, first_values))
+        if tag in _INERT_CONTENT_TAGS:
+            self._inert_tag = tag
+            self._inert_depth = 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag != self._inert_tag:
+            return
+        self._inert_depth -= 1
+        if not self._inert_depth:
+            self._inert_tag = None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_static_selector(selector: str) -> tuple[tuple[str | None, tuple[tuple[str, str, str], ...]], ...] | None:
+    """
+    Parse a selector list into (tag, conditions) alternatives, or None when it needs a real browser
+    (combinators, pseudo-classes, Playwright `text=` engines, ...).
+    """
+    alternatives = []
+    for raw in selector.split(","):
+        compound = raw.strip()
+        if not compound:
+            return None
+        tag = None
+        pos = 0
+        m = _STATIC_SELECTOR_TAG_RE.match(compound)
+        if m:
+            tag = m.group(0).lower()
+            pos = m.end()
+        conditions: list[tuple[str, str, str]] = []
+        while pos < len(compound):
+            part = _STATIC_SELECTOR_PART_RE.match(compound, pos)
+            if not part:
+                return None
+            id_, cls, attr, op, value = part.groups()
+            if id_ is not None:
+                conditions.append(("id", "=", id_))
+            elif cls is not None:
+                conditions.append(("class", "~=", cls))
+            else:
+                if value and value[0] in "\"'":
+                    value = value[1:-1]
+                conditions.append((attr.lower(), op or "", value or ""))
+            pos = part.end()
+        if tag is None and not conditions:
+            return None
+        alternatives.append((tag, tuple(conditions)))
+    return tuple(alternatives)
+
+
+def _static_selector_matches(selector: str, elements: list[tuple[str, dict[str, str | None]]]) -> bool:
+    alternatives = _parse_static_selector(selector) or ()
+    for element_tag, attrs in elements:
+        for tag, conditions in alternatives:
+            if tag is not None and tag != element_tag:
+                continue
+            for name, op, expected in conditions:
+                if name not in attrs:
+                    break
+                actual = attrs[name] or ""
+                if op == "=" and actual != expected:
+                    break
+                if op == "^=" and not actual.startswith(expected):
+                    break
+                if op == "$=" and not actual.endswith(expected):
+                    break
+                if op == "*=" and expected not in actual:
+                    break
+                if op == "~=" and expected not in actual.split():
+                    break
+            else:
+                return True
+    return False
+
+
+def spec_needs_browser(spec: DomainCheckSpec) -> bool:
+    """
+    True unless every browser assertion can be answered from the raw HTML: no title check and only
+    `attached` selectors in the simple CSS subset understood by `_parse_static_selector`.
+    Specs without any selector assertions keep the browser as their only "page renders" check.
+    """
+    if spec.expected_title_contains:
+        return True
+    if not spec.required_selectors_all and not spec.required_selectors_any:
+        return True
+    for check in [*spec.required_selectors_all, *spec.required_selectors_any]:
+        if check.state != "attached" or _parse_static_selector(check.selector) is None:
+            return True
+    return False
+
+
+class StaticHtmlDetails(TypedDict):
+    missing_selectors_all: list[str]
+    required_any_selectors: list[str]
+    required_any_ok: bool
+    missing_text: list[str]
+
+
+def static_html_check(spec: DomainCheckSpec, html: str, visible_text: str) -> tuple[bool, StaticHtmlDetails]:
+    """
+    Evaluate the browser-side assertions of a spec that does not need a browser (see `spec_needs_browser`).
+    """
+    collector = _TagCollector()
+    try:
+        collector.feed(html)
+        collector.close()
+    except Exception:
+        pass
+    elements = collector.elements
+
+    missing_all: list[str] = []
+    for check in spec.required_selectors_all:
+        if not _static_selector_matches(check.selector, elements):
+            missing_all.append(check.selector)
+    required_any_ok = True
+    if spec.required_selectors_any:
+        required_any_ok = any(_static_selector_matches(c.selector, elements) for c in spec.required_selectors_any)
+    missing_text: list[str] = []
+    for text, text_norm in spec.required_text_norm:
+        if text_norm not in visible_text:
+            missing_text.append(text)
+
+    ok = not missing_all and required_any_ok and not missing_text
+    details: StaticHtmlDetails = {
+        "missing_selectors_all": missing_all,
+        "required_any_selectors": [c.selector for c in spec.required_selectors_any],
+        "required_any_ok": required_any_ok,
+        "missing_text": missing_text,
+    }
+    return ok, details
+
+
 def _is_browser_infra_error(exc: Exception) -> bool:
     name = type(exc).__name__
     msg = str(exc or "").lower()
@@ -111,16 +432,50 @@ def _safe_url(url: str) -> str:
     if not s:
         return s
     try:
-        parts = urlsplit(s)
-        return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+        return _safe_url_from_parts(urlsplit(s))
     except Exception:
         return s[:500]
 
 
+def _safe_url_from_parts(parts: SplitResult) -> str:
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+
+
+@functools.lru_cache(maxsize=32)
+def _is_ascii_compatible_encoding(encoding: str) -> bool:
+    # True for utf-8/latin-1/cp1252-style charsets where ASCII letters are the same single bytes.
+    probe = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 '-"
+    try:
+        return probe.encode(encoding) == probe.encode("ascii")
+    except (LookupError, UnicodeError):
+        return False
+
+
+def _decode_body(body_bytes: bytes, encoding: str) -> str:
+    try:
+        return body_bytes.decode(encoding, errors="replace")
+    except LookupError:
+        return body_bytes.decode("utf-8", errors="replace")
+
+
 async def http_get_check(spec: DomainCheckSpec, client: httpx.AsyncClient) -> tuple[bool, dict[str, Any]]:
     started = time.perf_counter()
+    chunks: list[bytes] = []
+    body_size = 0
+    body_truncated = False
     try:
-        resp = await client.get(spec.url, follow_redirects=True, timeout=spec.http_timeout_seconds)
+        async with client.stream(
+            "GET", spec.url, follow_redirects=True, timeout=spec.http_timeout_seconds
+        ) as resp:
+            # Everything we assert on lives near the top of the document; don't buffer/decode huge bodies.
+            async for chunk in resp.aiter_bytes():
+                body_size += len(chunk)
+                if body_size >= HTTP_MAX_BODY_BYTES:
+                    # Trim the last chunk so the joined body is exactly the cap, without a second sliced copy.
+                    chunks.append(chunk[: len(chunk) - (body_size - HTTP_MAX_BODY_BYTES)])
+                    body_truncated = True
+                    break
+                chunks.append(chunk)
     except httpx.RequestError as e:
         elapsed_ms = (time.perf_counter() - started) * 1000.0
         return False, {
@@ -129,33 +484,57 @@ async def http_get_check(spec: DomainCheckSpec, client: httpx.AsyncClient) -> tu
         }
 
     elapsed_ms = (time.perf_counter() - started) * 1000.0
-    body = resp.text or ""
-    body_norm = _html_to_visible_text(body)
-
-    forbidden_hits = [kw for kw in spec.forbidden_text_any if kw and kw.lower() in body_norm]
+    body_bytes = b"".join(chunks)
+    encoding = resp.encoding or "utf-8"
+    # Cheap pre-scan on the raw body: tag stripping and whitespace folding never create characters, so
+    # every word of a keyword must already occur in the raw HTML. Only candidates need the full pass.
+    # With ASCII keywords and an ASCII-compatible charset this runs on the undecoded bytes, so healthy
+    # pages that need no further text checks are never decoded at all.
+    # Pure status/redirect probes (no forbidden text) skip the scan, and with it the lowered body copy.
+    body: str | None = None
+    if not spec.forbidden_words:
+        present_words: set[str] = set()
+    elif spec.forbidden_words_bytes is not None and _is_ascii_compatible_encoding(encoding):
+        body_lower_bytes = body_bytes.lower()
+        present_words = set()
+        for w, w_bytes in zip(spec.forbidden_words, spec.forbidden_words_bytes, strict=True):
+            if w_bytes in body_lower_bytes:
+                present_words.add(w)
+    else:
+        body = _decode_body(body_bytes, encoding)
+        body_lower = body.lower()
+        present_words = {w for w in spec.forbidden_words if w in body_lower}
+    candidates: list[tuple[str, str]] = []
+    for term, words in zip(spec.forbidden_text_lc, spec.forbidden_text_words, strict=True):
+        if words <= present_words:
+            candidates.append(term)
+    static_html = not spec_needs_browser(spec)
+    needs_visible_text = bool(candidates) or (bool(spec.required_text_all) and static_html)
+    if body is None and (needs_visible_text or static_html):
+        body = _decode_body(body_bytes, encoding)
+    body_norm = _html_to_visible_text(body) if body is not None and needs_visible_text else ""
+
+    forbidden_hits: list[str] = []
+    for kw, kw_lc in candidates:
+        if kw_lc in body_norm:
+            forbidden_hits.append(kw)
 
     captured_headers: dict[str, str] = {}
-    if spec.capture_headers:
-        deny = {"authorization", "cookie", "set-cookie"}
-        for raw_name in spec.capture_headers[:30]:
-            name = str(raw_name or "").strip()
-            if not name:
-                continue
-            key = name.lower()
-            if key in deny:
-                continue
-            if not re.fullmatch(r"[a-z0-9-]{1,80}", key):
-                continue
-            try:
-                val = resp.headers.get(name) or resp.headers.get(key)
-            except Exception:
-                val = None
-            if val is None:
-                continue
-            captured_headers[key] = str(val)[:300]
-
-    final_host = (urlsplit(str(resp.url)).hostname or "").lower()
-    expected_suffix = (spec.expected_final_host_suffix or "").strip().lower()
+    if spec.capture_header_keys:
+        # One pass over the response headers instead of a case-insensitive list scan per captured name.
+        # Repeated headers are comma-joined, matching `Headers.get`.
+        response_headers: dict[str, str] = {}
+        for name, value in resp.headers.multi_items():
+            previous = response_headers.get(name)
+            response_headers[name] = value if previous is None else f"{previous}, {value}"
+        for key in spec.capture_header_keys:
+            val = response_headers.get(key)
+            if val is not None:
+                captured_headers[key] = val[:300]
+
+    final_parts = urlsplit(str(resp.url))
+    final_host = (final_parts.hostname or "").lower()
+    expected_suffix = spec.expected_final_host_suffix_lc
     final_host_ok = True
     if expected_suffix:
         final_host_ok = bool(final_host) and final_host.endswith(expected_suffix)
@@ -166,9 +545,9 @@ async def http_get_check(spec: DomainCheckSpec, client: httpx.AsyncClient) -> tu
         status_ok = 200 <= resp.status_code < 300
 
     ok = status_ok and not forbidden_hits and final_host_ok
-    return ok, {
+    details: dict[str, Any] = {
         "status_code": resp.status_code,
-        "final_url": _safe_url(str(resp.url)),
+        "final_url": _safe_url_from_parts(final_parts),
         "final_host": final_host,
         "expected_final_host_suffix": expected_suffix or None,
         "final_host_ok": final_host_ok,
@@ -176,11 +555,20 @@ async def http_get_check(spec: DomainCheckSpec, client: httpx.AsyncClient) -> tu
         "captured_headers": captured_headers,
         "http_elapsed_ms": round(elapsed_ms, 3),
     }
+    if body_truncated:
+        details["body_truncated_at_bytes"] = HTTP_MAX_BODY_BYTES
+    if ok and static_html and body is not None:
+        # The browser would only confirm markup that is already in the HTML; when it is, skip Chromium.
+        # A miss is reported but not final: the caller falls back to the browser (JS may inject it).
+        static_ok, static_details = static_html_check(spec, body, body_norm)
+        details["static_html_ok"] = static_ok
+        if not static_ok:
+            details["static_html_details"] = static_details
+    return ok, details
 
 
 def _default_selector_state(selector: str) -> str:
-    sel = selector.lstrip()
-    if sel.startswith(("meta", "script", "link", "title")):
+    if _HEAD_ELEMENT_SELECTOR_RE.match(selector):
         return "attached"
     return "visible"
 
@@ -215,7 +603,7 @@ def load_domain_spec_from_module_dict(module_vars: dict[str, Any]) -> DomainChec
 
     forbidden = cfg.get("forbidden_text_any", None)
     if forbidden is None:
-        forbidden = list(DEFAULT_MAINTENANCE_TEXT)
+        forbidden = DEFAULT_MAINTENANCE_TEXT
 
     allowed_status_codes_raw = cfg.get("allowed_status_codes", None)
     allowed_status_codes: list[int] | None
@@ -246,29 +634,153 @@ def load_domain_spec_from_module_dict(module_vars: dict[str, Any]) -> DomainChec
     )
 
 
-async def browser_check(spec: DomainCheckSpec, browser: Browser) -> tuple[bool, dict[str, Any]]:
+async def _abort_heavy_resource(route: Route) -> None:
+    try:
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+            return
+    except Exception:
+        pass
+    await route.continue_()
+
+
+async def _new_check_context(browser: Browser) -> BrowserContext:
+    # Service workers are blocked so a cached worker can never answer for an origin that is down.
+    context = await browser.new_context(viewport={"width": 1280, "height": 720}, service_workers="block")
+    try:
+        await context.route("**/*", _abort_heavy_resource)
+    except Exception:
+        try:
+            await context.close()
+        except Exception:
+            pass
+        raise
+    return context
+
+
+class BrowserContextPool:
+    """
+    Warm BrowserContexts (viewport + resource blocking already applied) reused across browser checks.
+
+    Each check still gets a fresh page; the page origin's storage is cleared by the check, cookies are
+    cleared on release, and a context that still holds localStorage for any origin is recycled, as is one
+    that hit `max_uses` checks or any failure, so long-lived state cannot pile up. Contexts belong to one
+    Browser: when the monitor relaunches Chromium, the stale idle contexts are dropped on next acquire.
+    """
+
+    def __init__(self, *, size: int, max_uses: int = 50) -> None:
+        self.size = max(1, int(size))
+        self.max_uses = max(1, int(max_uses))
+        self._browser: Browser | None = None
+        self._idle: list[BrowserContext] = []
+        self._uses: dict[BrowserContext, int] = {}
+
+    async def acquire(self, browser: Browser) -> BrowserContext:
+        if browser is not self._browser:
+            await self.close()
+            self._browser = browser
+        if self._idle:
+            return self._idle.pop()
+        context = await _new_check_context(browser)
+        self._uses[context] = 0
+        return context
+
+    async def release(self, context: BrowserContext, *, reusable: bool) -> None:
+        uses = self._uses.pop(context, 0) + 1
+        if reusable and uses < self.max_uses and len(self._idle) < self.size:
+            try:
+                await context.clear_cookies()
+                state = await context.storage_state()
+            except Exception:
+                state = None
+            if state is not None and not state.get("origins"):
+                self._uses[context] = uses
+                self._idle.append(context)
+                return
+        try:
+            await context.close()
+        except Exception:
+            pass
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for context in idle:
+            self._uses.pop(context, None)
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+
+async def _read_title_and_text(page: Page) -> tuple[str, str]:
+    # Title and body text in one driver round-trip; separate calls if the combined evaluate fails.
+    try:
+        title, raw_text = await page.evaluate(_TITLE_AND_TEXT_JS)
+    except PlaywrightError:
+        title = await page.title()
+        raw_text = await page.evaluate("() => document.body?.innerText || ''")
+    return title, raw_text
+
+
+async def _wait_for_any_selector(page: Page, checks: list[SelectorCheck], timeout_ms: int) -> bool:
+    """True as soon as one of `checks` reaches its state; vacuously True when there are none."""
+    if not checks:
+        return True
+    tasks = [
+        asyncio.create_task(page.wait_for_selector(check.selector, state=check.state, timeout=timeout_ms))
+        for check in checks
+    ]
+    pending: set[asyncio.Task[Any]] = set(tasks)
+    deadline = asyncio.get_running_loop().time() + (timeout_ms / 1000.0)
+    try:
+        while pending:
+            remaining = max(0.0, deadline - asyncio.get_running_loop().time())
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                try:
+                    await task
+                except PlaywrightTimeoutError:
+                    continue
+                except Exception:
+                    continue
+                else:
+                    return True
+    finally:
+        for task in pending:
+            task.cancel()
+        for task in pending:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                pass
+    return False
+
+
+async def browser_check(
+    spec: DomainCheckSpec,
+    browser: Browser,
+    *,
+    context_pool: BrowserContextPool | None = None,
+) -> tuple[bool, dict[str, Any]]:
     started = time.perf_counter()
     timeout_ms = int(spec.browser_timeout_seconds * 1000)
 
     context = None
     page = None
+    reusable = False
     try:
         try:
-            context = await browser.new_context(viewport={"width": 1280, "height": 720})
+            if context_pool is not None:
+                context = await context_pool.acquire(browser)
+            else:
+                context = await _new_check_context(browser)
             page = await context.new_page()
-            try:
-                async def _route_filter(route):
-                    try:
-                        if route.request.resource_type in {'image', 'media', 'font'}:
-                            await route.abort()
-                            return
-                    except Exception:
-                        pass
-                    await route.continue_()
-            
-                await context.route('**/*', _route_filter)
-            except Exception:
-                pass
         except Exception as e:
             connected = None
             try:
@@ -325,72 +837,54 @@ async def browser_check(spec: DomainCheckSpec, browser: Browser) -> tuple[bool,
 
         status = response.status if response else None
 
-        title = await page.title()
-        title_ok = True
-        if spec.expected_title_contains:
-            title_ok = spec.expected_title_contains.lower() in (title or "").lower()
-
-        final_host = (urlsplit(page.url).hostname or "").lower()
-        expected_suffix = (spec.expected_final_host_suffix or "").strip().lower()
+        final_parts = urlsplit(page.url)
+        final_host = (final_parts.hostname or "").lower()
+        expected_suffix = spec.expected_final_host_suffix_lc
         final_host_ok = True
         if expected_suffix:
             final_host_ok = bool(final_host) and final_host.endswith(expected_suffix)
 
-        body_text = _normalize_text(await page.evaluate("() => document.body?.innerText || ''"))
-        forbidden_hits = [kw for kw in spec.forbidden_text_any if kw and kw.lower() in body_text]
+        # Read the title/body text while the selector waits run: they are independent driver round-trips.
+        # Every selector is waited on concurrently, the "all" and "any" groups included, so a spec with
+        # missing selectors costs one timeout instead of one per selector (or per group).
+        all_selector_waits = [
+            page.wait_for_selector(check.selector, state=check.state, timeout=timeout_ms)
+            for check in spec.required_selectors_all
+        ]
+        text_result, all_results, any_result = await asyncio.gather(
+            _read_title_and_text(page),
+            asyncio.gather(*all_selector_waits, return_exceptions=True),
+            _wait_for_any_selector(page, spec.required_selectors_any, timeout_ms),
+            return_exceptions=True,
+        )
+        for outcome in (text_result, all_results, any_result):
+            if isinstance(outcome, BaseException):
+                raise outcome
+        title, raw_text = text_result
+        any_ok = any_result
+
+        title_ok = True
+        if spec.expected_title_lc:
+            title_ok = spec.expected_title_lc in (title or "").lower()
+
+        body_text = _normalize_text(raw_text)
+        forbidden_hits: list[str] = []
+        for kw, kw_lc in spec.forbidden_text_lc:
+            if kw_lc in body_text:
+                forbidden_hits.append(kw)
 
         missing_all: list[str] = []
-        for check in spec.required_selectors_all:
-            try:
-                await page.wait_for_selector(check.selector, state=check.state, timeout=timeout_ms)
-            except PlaywrightTimeoutError:
+        for check, result in zip(spec.required_selectors_all, all_results, strict=True):
+            if isinstance(result, PlaywrightTimeoutError):
                 missing_all.append(check.selector)
-
-        any_ok = True
+            elif isinstance(result, BaseException):
+                raise result
         any_candidates = [c.selector for c in spec.required_selectors_any]
-        if spec.required_selectors_any:
-            any_ok = False
-            tasks = [
-                asyncio.create_task(
-                    page.wait_for_selector(check.selector, state=check.state, timeout=timeout_ms)
-                )
-                for check in spec.required_selectors_any
-            ]
-            pending: set[asyncio.Task[Any]] = set(tasks)
-            deadline = asyncio.get_running_loop().time() + (timeout_ms / 1000.0)
-            try:
-                while pending and not any_ok:
-                    remaining = max(0.0, deadline - asyncio.get_running_loop().time())
-                    if remaining <= 0:
-                        break
-                    done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
-                    if not done:
-                        break
-                    for task in done:
-                        try:
-                            await task
-                        except PlaywrightTimeoutError:
-                            continue
-                        except Exception:
-                            continue
-                        else:
-                            any_ok = True
-                            break
-            finally:
-                for task in pending:
-                    task.cancel()
-                for task in pending:
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-                    except Exception:
-                        pass
 
         missing_text: list[str] = []
-        for t in spec.required_text_all:
-            if _normalize_text(t) not in body_text:
-                missing_text.append(t)
+        for text, text_norm in spec.required_text_norm:
+            if text_norm not in body_text:
+                missing_text.append(text)
 
         if status is None:
             status_ok = False
@@ -410,8 +904,9 @@ async def browser_check(spec: DomainCheckSpec, browser: Browser) -> tuple[bool,
         )
 
         elapsed_ms = (time.perf_counter() - started) * 1000.0
+        reusable = True
         return ok, {
-            "final_url": _safe_url(page.url),
+            "final_url": _safe_url_from_parts(final_parts),
             "final_host": final_host,
             "expected_final_host_suffix": expected_suffix or None,
             "final_host_ok": final_host_ok,
@@ -451,20 +946,33 @@ async def browser_check(spec: DomainCheckSpec, browser: Browser) -> tuple[bool,
             "browser_elapsed_ms": round(elapsed_ms, 3),
         }
     finally:
+        if page is not None and reusable and context_pool is not None:
+            try:
+                await page.evaluate(_CLEAR_STORAGE_JS)
+            except Exception:
+                reusable = False
         if page is not None:
             try:
                 await page.close()
             except Exception:
                 pass
         if context is not None:
-            try:
-                await context.close()
-            except Exception:
-                pass
+            if context_pool is not None:
+                await context_pool.release(context, reusable=reusable)
+            else:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
 
 
 def find_chromium_executable() -> str | None:
-    env_path = os.getenv("CHROMIUM_PATH")
+    return _find_chromium_executable_for(os.getenv("CHROMIUM_PATH") or "")
+
+
+# Installed browsers don't move while the process runs; probe the filesystem once per CHROMIUM_PATH value.
+@functools.lru_cache(maxsize=4)
+def _find_chromium_executable_for(env_path: str) -> str | None:
     if env_path and Path(env_path).exists():
         return env_path
 
@@ -479,3 +987,19 @@ def find_chromium_executable() -> str | None:
         if Path(path).exists():
             return path
     return None
+
+
+def make_http_client(*, user_agent: str) -> httpx.AsyncClient:
+    """
+    One long-lived client per process (monitor loop, E2E runner): idle connections survive between
+    cycles (keep-alive just above the 60s default interval) and HTTP/2 multiplexes probes that share a
+    host when the optional `h2` package is installed. Per-request timeouts are passed by each caller.
+    A failed connection attempt (refused/reset/connect timeout) is retried once on a fresh connection;
+    requests that reached the server are never replayed.
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=75.0),
+        retries=1,
+    )
+    return httpx.AsyncClient(headers={"User-Agent": user_agent}, transport=transport)
@@ -3,13 +3,19 @@ from __future__ import annotations
 import asyncio
 import json
 import time
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from typing import Any
 from urllib.parse import urlparse
 
 import httpx
 
 _RETIRED_DISPATCH_HOSTS = frozenset({"dispatch.pitchai.net"})
+_TERMINAL_QUEUE_STATES = frozenset({"processed", "failed", "runner_error"})
+
+# One decoded JSON line of a runner exec log.
+type _JsonValue = str | int | float | bool | None | list[_JsonValue] | dict[str, _JsonValue]
+type _ExecLogEvent = dict[str, _JsonValue]
 
 
 @dataclass(frozen=True)
@@ -20,6 +26,11 @@ class DispatchConfig:
     poll_interval_seconds: float = 5.0
     max_wait_seconds: float = 30 * 60
     log_tail_bytes: int = 250_000
+    # `base_url` without trailing slashes, derived once for building endpoint URLs.
+    base_url_stripped: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "base_url_stripped", self.base_url.rstrip("/"))
 
 
 def dispatch_endpoint_unavailable_reason(base_url: str) -> str | None:
@@ -51,17 +62,30 @@ def parse_dispatch_response(text: str) -> tuple[str, str]:
     return bundle, runner
 
 
-def extract_last_agent_message_from_exec_log(text: str) -> str | None:
-    for line in reversed((text or "").splitlines()):
-        s = line.strip()
-        if not s.startswith("{"):
+def _iter_json_objects_reversed(text: str, *, marker: str) -> Iterator[_ExecLogEvent]:
+    """
+    Yield the JSON-object lines of an exec log that contain `marker`, last line first. Walks backwards
+    with `rfind` instead of `splitlines()`, so finding a message near the end of a multi-MB log doesn't
+    split the whole log, and the substring test keeps large unrelated lines (tool output, diffs) out of
+    `json.loads`.
+    """
+    end = len(text)
+    while end > 0:
+        start = text.rfind("\n", 0, end) + 1
+        s = text[start:end].strip()
+        end = start - 1
+        if not s.startswith("{") or marker not in s:
             continue
         try:
             obj = json.loads(s)
         except Exception:
             continue
-        if not isinstance(obj, dict):
-            continue
+        if isinstance(obj, dict):
+            yield obj
+
+
+def extract_last_agent_message_from_exec_log(text: str) -> str | None:
+    for obj in _iter_json_objects_reversed(text or "", marker='"agent_message"'):
         if str(obj.get("type") or "") not in {"item.completed", "item.updated"}:
             continue
         item = obj.get("item")
@@ -83,16 +107,8 @@ def extract_last_error_message_from_exec_log(text: str) -> str | None:
     - {"type":"error","message":"..."}
     - {"type":"turn.failed","error":{"message":"..."}}
     """
-    for line in reversed((text or "").splitlines()):
-        s = line.strip()
-        if not s.startswith("{"):
-            continue
-        try:
-            obj = json.loads(s)
-        except Exception:
-            continue
-        if not isinstance(obj, dict):
-            continue
+    # Both shapes carry an "error" string: the type value or the error key.
+    for obj in _iter_json_objects_reversed(text or "", marker='"error"'):
         typ = str(obj.get("type") or "")
         if typ == "error":
             msg = obj.get("message")
@@ -131,7 +147,7 @@ async def dispatch_job(
     if pre_commands:
         payload["pre_commands"] = list(pre_commands)
 
-    url = f"{cfg.base_url.rstrip('/')}/dispatch"
+    url = f"{cfg.base_url_stripped}/dispatch"
     resp = await client.post(
         url,
         headers={"X-PitchAI-Dispatch-Token": cfg.token},
@@ -143,7 +159,7 @@ async def dispatch_job(
 
 
 async def get_run_status(client: httpx.AsyncClient, cfg: DispatchConfig, *, bundle: str) -> dict[str, Any]:
-    url = f"{cfg.base_url.rstrip('/')}/runs/{bundle}/status"
+    url = f"{cfg.base_url_stripped}/runs/{bundle}/status"
     resp = await client.get(
         url,
         headers={"X-PitchAI-Dispatch-Token": cfg.token},
@@ -157,7 +173,7 @@ async def get_run_status(client: httpx.AsyncClient, cfg: DispatchConfig, *, bund
 
 
 async def get_run_record(client: httpx.AsyncClient, cfg: DispatchConfig, *, bundle: str) -> dict[str, Any]:
-    url = f"{cfg.base_url.rstrip('/')}/runs/{bundle}/record"
+    url = f"{cfg.base_url_stripped}/runs/{bundle}/record"
     resp = await client.get(
         url,
         headers={"X-PitchAI-Dispatch-Token": cfg.token},
@@ -171,7 +187,8 @@ async def get_run_record(client: httpx.AsyncClient, cfg: DispatchConfig, *, bund
 
 
 def is_terminal_queue_state(queue_state: Any) -> bool:
-    return str(queue_state or "") in {"processed", "failed", "runner_error"}
+    # Queue states arrive as JSON strings; anything else (None, missing) is non-terminal.
+    return isinstance(queue_state, str) and queue_state in _TERMINAL_QUEUE_STATES
 
 
 def _is_transient_dispatch_error(exc: Exception) -> bool:
@@ -212,36 +229,57 @@ async def wait_for_terminal_status(client: httpx.AsyncClient, cfg: DispatchConfi
         await asyncio.sleep(max(0.5, cfg.poll_interval_seconds))
 
 
+# Last seen log size per log URL. Terminal logs are read more than once (tail, then agent/error message
+# fallbacks); a known size lets the tail read skip the size probe and take a single round-trip.
+_LOG_SIZE_CACHE: dict[str, int] = {}
+_LOG_SIZE_CACHE_MAX = 128
+
+
 async def _get_log_tail(
     client: httpx.AsyncClient, cfg: DispatchConfig, *, bundle: str, max_bytes: int
 ) -> str:
-    url = f"{cfg.base_url.rstrip('/')}/runs/{bundle}/log"
-    head = await client.get(
-        url,
-        headers={"X-PitchAI-Dispatch-Token": cfg.token},
-        params={"offset": 0, "max_bytes": 1},
-        timeout=20.0,
-    )
-    head.raise_for_status()
-    head_data = head.json()
-    if not isinstance(head_data, dict) or not head_data.get("exists"):
-        return ""
-
-    size = int(head_data.get("size") or 0)
+    url = f"{cfg.base_url_stripped}/runs/{bundle}/log"
     max_bytes = max(1, min(int(max_bytes), 5_000_000))
-    offset = max(0, size - max_bytes)
-
-    tail = await client.get(
-        url,
-        headers={"X-PitchAI-Dispatch-Token": cfg.token},
-        params={"offset": offset, "max_bytes": max_bytes},
-        timeout=30.0,
-    )
-    tail.raise_for_status()
-    tail_data = tail.json()
-    if not isinstance(tail_data, dict):
-        return ""
-    return str(tail_data.get("content") or "")
+    size = _LOG_SIZE_CACHE.get(url)
+    if size is None:
+        head = await client.get(
+            url,
+            headers={"X-PitchAI-Dispatch-Token": cfg.token},
+            params={"offset": 0, "max_bytes": 1},
+            timeout=20.0,
+        )
+        head.raise_for_status()
+        head_data = head.json()
+        if not isinstance(head_data, dict) or not head_data.get("exists"):
+            return ""
+        size = int(head_data.get("size") or 0)
+
+    content = ""
+    for _attempt in range(2):
+        offset = max(0, size - max_bytes)
+        tail = await client.get(
+            url,
+            headers={"X-PitchAI-Dispatch-Token": cfg.token},
+            params={"offset": offset, "max_bytes": max_bytes},
+            timeout=30.0,
+        )
+        tail.raise_for_status()
+        tail_data = tail.json()
+        if not isinstance(tail_data, dict) or not tail_data.get("exists", True):
+            _LOG_SIZE_CACHE.pop(url, None)
+            return ""
+        content = str(tail_data.get("content") or "")
+        current_size = int(tail_data.get("size") or size)
+        stale = current_size != size
+        size = current_size
+        # A cached size can lag a log that was still being written; re-read once at the real tail.
+        if not stale or offset == max(0, size - max_bytes):
+            break
+
+    if url not in _LOG_SIZE_CACHE and len(_LOG_SIZE_CACHE) >= _LOG_SIZE_CACHE_MAX:
+        _LOG_SIZE_CACHE.pop(next(iter(_LOG_SIZE_CACHE)))
+    _LOG_SIZE_CACHE[url] = size
+    return content
 
 
 async def get_run_log_tail(client: httpx.AsyncClient, cfg: DispatchConfig, *, bundle: str) -> str:
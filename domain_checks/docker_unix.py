@@ -3,6 +3,7 @@ from __future__ import annotations
 import http.client
 import json
 import socket
+import threading
 from dataclasses import dataclass
 from typing import Any
 
@@ -19,6 +20,13 @@ class _UnixHTTPConnection(http.client.HTTPConnection):
         self.sock = sock
 
 
+# Idle keep-alive connections per socket path. Container health probes run one request per container
+# (via worker threads), so reusing connections saves a socket()+connect() per Docker API call.
+_IDLE_CONNECTIONS: dict[str, list[_UnixHTTPConnection]] = {}
+_IDLE_CONNECTIONS_LOCK = threading.Lock()
+_MAX_IDLE_CONNECTIONS_PER_SOCKET = 8
+
+
 @dataclass(frozen=True)
 class DockerUnixResponse:
     status: int
@@ -27,6 +35,53 @@ class DockerUnixResponse:
     error: str | None
 
 
+def _checkout_connection(socket_path: str, timeout: float) -> tuple[_UnixHTTPConnection, bool]:
+    with _IDLE_CONNECTIONS_LOCK:
+        idle = _IDLE_CONNECTIONS.get(socket_path)
+        conn = idle.pop() if idle else None
+    if conn is None:
+        return _UnixHTTPConnection(socket_path=socket_path, timeout=timeout), False
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _checkin_connection(socket_path: str, conn: _UnixHTTPConnection) -> None:
+    with _IDLE_CONNECTIONS_LOCK:
+        idle = _IDLE_CONNECTIONS.setdefault(socket_path, [])
+        if len(idle) < _MAX_IDLE_CONNECTIONS_PER_SOCKET:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _unix_get(socket_path: str, path: str, timeout: float) -> tuple[int, bytes]:
+    """
+    GET over a pooled keep-alive connection. An idle connection the daemon already closed (restart,
+    idle timeout) fails on first use; that request is retried on the next idle or a fresh connection.
+    """
+    while True:
+        conn, reused = _checkout_connection(socket_path, timeout)
+        try:
+            conn.request("GET", path, headers={"Host": "docker"})
+            resp = conn.getresponse()
+            raw = resp.read()
+        except (ConnectionError, http.client.HTTPException):
+            conn.close()
+            if reused:
+                continue
+            raise
+        except BaseException:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            _checkin_connection(socket_path, conn)
+        return int(resp.status), raw
+
+
 def docker_unix_get_json(*, socket_path: str, path: str, timeout_seconds: float = 5.0) -> DockerUnixResponse:
     """
     Minimal Docker Engine API client over /var/run/docker.sock.
@@ -40,26 +95,16 @@ def docker_unix_get_json(*, socket_path: str, path: str, timeout_seconds: float
     if not p.startswith("/"):
         p = "/" + p
 
-    conn: _UnixHTTPConnection | None = None
     try:
-        conn = _UnixHTTPConnection(socket_path=sp, timeout=max(0.5, float(timeout_seconds)))
-        conn.request("GET", p, headers={"Host": "docker"})
-        resp = conn.getresponse()
-        raw = resp.read()
-        status = int(resp.status)
-        try:
-            data = json.loads(raw.decode("utf-8")) if raw else None
-        except Exception:
-            data = raw.decode("utf-8", errors="replace")
-        ok = 200 <= status < 300
-        return DockerUnixResponse(status=status, ok=ok, data=data, error=None if ok else f"http_{status}")
+        status, raw = _unix_get(sp, p, max(0.5, float(timeout_seconds)))
     except FileNotFoundError:
         return DockerUnixResponse(status=0, ok=False, data=None, error="socket_not_found")
     except Exception as exc:
         return DockerUnixResponse(status=0, ok=False, data=None, error=f"{type(exc).__name__}: {exc}")
-    finally:
-        if conn is not None:
-            try:
-                conn.close()
-            except Exception:
-                pass
+
+    try:
+        data = json.loads(raw.decode("utf-8")) if raw else None
+    except Exception:
+        data = raw.decode("utf-8", errors="replace")
+    ok = 200 <= status < 300
+    return DockerUnixResponse(status=status, ok=ok, data=data, error=None if ok else f"http_{status}")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from bisect import bisect_left
+from operator import itemgetter
 from typing import Any, Iterable
 
 
@@ -11,8 +12,13 @@ from typing import Any, Iterable
 # - ok: bool
 # - http_elapsed_ms/browser_elapsed_ms: float | None
 # - status_code: int | None
+#
+# `ts` is always a float in memory: coerce_history and append_sample are the only ingestion points and
+# both coerce it, so sorting/bisecting reads it as-is.
 Sample = list[Any]
 
+_sample_ts = itemgetter(0)
+
 
 def coerce_history(raw: Any) -> dict[str, list[Sample]]:
     """
@@ -62,7 +68,7 @@ def coerce_history(raw: Any) -> dict[str, list[Sample]]:
 
             samples.append([ts, ok, http_ms, browser_ms, status_code])
 
-        samples.sort(key=lambda s: float(s[0] or 0.0))
+        samples.sort(key=_sample_ts)
         if samples:
             out[domain] = samples
 
@@ -97,11 +103,11 @@ def append_sample(
 
     # Normal case: we append in time-order (cycle order). If a clock jump or out-of-order
     # append happens, fall back to sorted insert.
-    if not items or float(items[-1][0] or 0.0) <= float(sample[0] or 0.0):
+    if not items or items[-1][0] <= sample[0]:
         items.append(sample)
         return
 
-    idx = bisect_left([float(s[0] or 0.0) for s in items], float(sample[0] or 0.0))
+    idx = bisect_left(items, sample[0], key=_sample_ts)
     items.insert(idx, sample)
 
 
@@ -113,9 +119,8 @@ def prune_history(history: dict[str, list[Sample]], *, before_ts: float) -> None
             del history[domain]
             continue
 
-        # Find first sample with ts >= cutoff.
-        ts_list = [float(s[0] or 0.0) for s in items]
-        idx = bisect_left(ts_list, cutoff)
+        # Find first sample with ts >= cutoff (bisect over the samples; no parallel timestamp list).
+        idx = bisect_left(items, cutoff, key=_sample_ts)
         if idx <= 0:
             continue
         if idx >= len(items):
@@ -128,8 +133,7 @@ def window_samples(items: list[Sample], *, since_ts: float) -> list[Sample]:
     if not items:
         return []
     cutoff = float(since_ts)
-    ts_list = [float(s[0] or 0.0) for s in items]
-    idx = bisect_left(ts_list, cutoff)
+    idx = bisect_left(items, cutoff, key=_sample_ts)
     return items[idx:]
 
 
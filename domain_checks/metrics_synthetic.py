@@ -11,7 +11,10 @@ from urllib.parse import urljoin
 
 from playwright.async_api import Browser, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 
-from domain_checks.common_check import _is_browser_infra_error  # noqa: SLF001
+from domain_checks.common_check import (  # noqa: SLF001
+    _abort_heavy_resource,
+    _is_browser_infra_error,
+)
 
 
 @dataclass(frozen=True)
@@ -70,16 +73,7 @@ def _write_artifact(path: str, content: str) -> None:
 
 async def _apply_route_filter(context) -> None:
     try:
-        async def _route_filter(route):
-            try:
-                if route.request.resource_type in {"image", "media", "font"}:
-                    await route.abort()
-                    return
-            except Exception:
-                pass
-            await route.continue_()
-
-        await context.route("**/*", _route_filter)
+        await context.route("**/*", _abort_heavy_resource)
     except Exception:
         pass
 
@@ -1,18 +1,69 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 from dataclasses import dataclass
 
 import httpx
 
 
+# Telegram allows ~20 messages/minute into one group chat; a DOWN storm across many domains would
+# otherwise hit 429s. Private chats allow more, so the rate is configurable per TelegramConfig.
+TELEGRAM_DEFAULT_MESSAGES_PER_MINUTE = 20.0
+
+
 @dataclass(frozen=True)
 class TelegramConfig:
     bot_token: str
     chat_id: str
+    messages_per_minute: float = TELEGRAM_DEFAULT_MESSAGES_PER_MINUTE
 
 
 TELEGRAM_MAX_MESSAGE_LEN = 3900
+TELEGRAM_MAX_RETRY_AFTER_SECONDS = 30.0
+
+
+class TokenBucket:
+    """
+    Lock-free token bucket: a caller reserves its slot synchronously and sleeps outside any shared state.
+
+    Reservations never await, so the bucket is safe to share between event loops (monitor and registry).
+    Sends are queued, never dropped: once the burst is spent each reservation waits for its own slot.
+    """
+
+    def __init__(self, *, rate: float, burst: int) -> None:
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait before using it."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        wait = max(0.0, (1.0 - self._tokens) / self.rate)
+        self._tokens -= 1.0
+        return wait
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_CHAT_BUCKETS: dict[tuple[str, float], TokenBucket] = {}
+
+
+def _chat_bucket(config: TelegramConfig) -> TokenBucket:
+    per_minute = max(1.0, float(config.messages_per_minute))
+    key = (str(config.chat_id), per_minute)
+    bucket = _CHAT_BUCKETS.get(key)
+    if bucket is None:
+        bucket = TokenBucket(rate=per_minute / 60.0, burst=int(per_minute))
+        _CHAT_BUCKETS[key] = bucket
+    return bucket
 
 
 def split_telegram_message(text: str, *, max_len: int = TELEGRAM_MAX_MESSAGE_LEN) -> list[str]:
@@ -40,9 +91,18 @@ async def send_telegram_message(
 ) -> tuple[bool, dict]:
     url = f"https://api.telegram.org/bot{config.bot_token}/sendMessage"
     payload = {"chat_id": config.chat_id, "text": text}
+    bucket = _chat_bucket(config)
     try:
+        await bucket.acquire()
         resp = await client.post(url, json=payload, timeout=15.0)
         data = resp.json()
+        retry_after = (data.get("parameters") or {}).get("retry_after") if resp.status_code == 429 else None
+        if isinstance(retry_after, (int, float)) and 0 < retry_after <= TELEGRAM_MAX_RETRY_AFTER_SECONDS:
+            # Honour Telegram's flood control once instead of failing the alert outright.
+            await asyncio.sleep(float(retry_after))
+            await bucket.acquire()
+            resp = await client.post(url, json=payload, timeout=15.0)
+            data = resp.json()
         return bool(data.get("ok")), data
     except Exception as e:
         msg = f"{type(e).__name__}: {e}"
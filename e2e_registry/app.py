@@ -14,10 +14,12 @@ from typing import Any
 from urllib.parse import urlsplit
 
 import httpx
+import jinja2
 from fastapi import Depends, FastAPI, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 
+from domain_checks.common_check import make_http_client
 from e2e_registry import db as dbm
 from e2e_registry import monitor_dashboard as md
 from e2e_registry.alerts import (
@@ -182,8 +184,22 @@ def create_app(settings: RegistrySettings | None = None) -> FastAPI:
     app.state.monitor_cache = {"loaded_at_ts": 0.0, "state_mtime": None, "config_mtime": None, "data": None}
 
     templates_dir = Path(__file__).parent / "templates"
-    templates = Jinja2Templates(directory=str(templates_dir))
+    # Templates ship with the image: compile each once and skip the per-render mtime check.
+    templates = Jinja2Templates(
+        env=jinja2.Environment(
+            loader=jinja2.FileSystemLoader(str(templates_dir)),
+            autoescape=True,
+            auto_reload=False,
+        )
+    )
     app.state.templates = templates
+    # One keep-alive client for Telegram alerts and dispatcher escalations across run completions,
+    # instead of a new client (and TLS handshake) per completed run.
+    app.state.http_client = make_http_client(user_agent="PitchAI E2E Registry")
+
+    @app.on_event("shutdown")
+    async def _shutdown() -> None:
+        await app.state.http_client.aclose()
 
     @app.on_event("startup")
     def _startup() -> None:
@@ -1282,96 +1298,96 @@ def create_app(settings: RegistrySettings | None = None) -> FastAPI:
         outcome = await asyncio.to_thread(dbm.complete_run, app.state.settings, run_id=run_id, completion=completion)
 
         # Send alerts out-of-band (after DB commit).
-        async with httpx.AsyncClient(headers={"User-Agent": "PitchAI E2E Registry"}) as http_client:
-            if outcome.alerted_down and outcome.updated and outcome.tenant_id and outcome.test_id and outcome.test_name:
-                cfg = await asyncio.to_thread(
-                    dbm.get_test_config_internal, app.state.settings, test_id=outcome.test_id
-                )
-                down_after = int(cfg.get("down_after_failures") or 2) if isinstance(cfg, dict) else 2
-                test_kind = str(cfg.get("test_kind") or "stepflow") if isinstance(cfg, dict) else "stepflow"
-                msg = build_failure_telegram_message(
-                    settings=app.state.settings,
-                    tenant_id=outcome.tenant_id,
+        http_client: httpx.AsyncClient = app.state.http_client
+        if outcome.alerted_down and outcome.updated and outcome.tenant_id and outcome.test_id and outcome.test_name:
+            cfg = await asyncio.to_thread(
+                dbm.get_test_config_internal, app.state.settings, test_id=outcome.test_id
+            )
+            down_after = int(cfg.get("down_after_failures") or 2) if isinstance(cfg, dict) else 2
+            test_kind = str(cfg.get("test_kind") or "stepflow") if isinstance(cfg, dict) else "stepflow"
+            msg = build_failure_telegram_message(
+                settings=app.state.settings,
+                tenant_id=outcome.tenant_id,
+                test_id=outcome.test_id,
+                test_name=outcome.test_name,
+                test_kind=test_kind,
+                run_id=run_id,
+                fail_streak=int(outcome.fail_streak or 0),
+                down_after_failures=down_after,
+                error_kind=req.error_kind,
+                error_message=req.error_message,
+                final_url=req.final_url,
+                artifacts=req.artifacts,
+            )
+            await maybe_send_failure_alert(http_client=http_client, settings=app.state.settings, msg=msg)
+
+            # Optional dispatcher escalation.
+            if isinstance(cfg, dict) and bool(int(cfg.get("dispatch_on_failure") or 0)):
+                prompt = build_dispatch_prompt_for_failure(
                     test_id=outcome.test_id,
                     test_name=outcome.test_name,
                     test_kind=test_kind,
+                    base_url=str(cfg.get("base_url") or ""),
                     run_id=run_id,
-                    fail_streak=int(outcome.fail_streak or 0),
-                    down_after_failures=down_after,
                     error_kind=req.error_kind,
                     error_message=req.error_message,
-                    final_url=req.final_url,
                     artifacts=req.artifacts,
                 )
-                await maybe_send_failure_alert(http_client=http_client, settings=app.state.settings, msg=msg)
-
-                # Optional dispatcher escalation.
-                if isinstance(cfg, dict) and bool(int(cfg.get("dispatch_on_failure") or 0)):
-                    prompt = build_dispatch_prompt_for_failure(
-                        test_id=outcome.test_id,
-                        test_name=outcome.test_name,
-                        test_kind=test_kind,
-                        base_url=str(cfg.get("base_url") or ""),
-                        run_id=run_id,
-                        error_kind=req.error_kind,
-                        error_message=req.error_message,
-                        artifacts=req.artifacts,
+                dispatch_context = {
+                    "tenant_id": outcome.tenant_id,
+                    "test_id": outcome.test_id,
+                    "test_name": outcome.test_name,
+                    "test_kind": test_kind,
+                    "base_url": str(cfg.get("base_url") or ""),
+                    "run_id": run_id,
+                }
+                try:
+                    await maybe_dispatch_failure_investigation(
+                        http_client=http_client,
+                        settings=runtime_settings,
+                        prompt=prompt,
+                        context=dispatch_context,
                     )
-                    dispatch_context = {
-                        "tenant_id": outcome.tenant_id,
-                        "test_id": outcome.test_id,
-                        "test_name": outcome.test_name,
-                        "test_kind": test_kind,
-                        "base_url": str(cfg.get("base_url") or ""),
-                        "run_id": run_id,
-                    }
-                    try:
-                        await maybe_dispatch_failure_investigation(
-                            http_client=http_client,
-                            settings=runtime_settings,
-                            prompt=prompt,
-                            context=dispatch_context,
-                        )
-                    except (httpx.HTTPError, TimeoutError, ValueError) as exc:
-                        error_detail = f"{type(exc).__name__}: {exc}"
-                        dispatch_token = runtime_settings.dispatch_token
-                        error_detail = (
-                            error_detail.replace(dispatch_token, "<redacted>") if dispatch_token else error_detail
-                        )
-                        error_detail = error_detail[:5_000]
-                        LOGGER.error("Dispatcher triage request failed error=%s", error_detail)
-                        await asyncio.to_thread(
-                            dbm.insert_dispatch_run,
-                            runtime_settings,
-                            state_key="e2e-registry.failure",
-                            bundle=None,
-                            ui_url=None,
-                            queue_state="dispatch_error",
-                            agent_message=None,
-                            error_message=error_detail,
-                            context=dispatch_context,
-                        )
-                        await maybe_send_failure_alert(
-                            http_client=http_client,
-                            settings=runtime_settings,
-                            msg=(
-                                "Dispatcher triage unavailable state=dispatch_error\n"
-                                f"Error: {error_detail[:500]}"
-                            ),
-                        )
-
-            if outcome.recovered_up and outcome.updated and outcome.test_id and outcome.test_name:
-                cfg = await asyncio.to_thread(
-                    dbm.get_test_config_internal, app.state.settings, test_id=outcome.test_id
-                )
-                if isinstance(cfg, dict) and bool(int(cfg.get("notify_on_recovery") or 0)):
-                    msg = build_recovery_telegram_message(
-                        settings=app.state.settings,
-                        test_id=outcome.test_id,
-                        test_name=outcome.test_name,
-                        run_id=run_id,
+                except (httpx.HTTPError, TimeoutError, ValueError) as exc:
+                    error_detail = f"{type(exc).__name__}: {exc}"
+                    dispatch_token = runtime_settings.dispatch_token
+                    error_detail = (
+                        error_detail.replace(dispatch_token, "<redacted>") if dispatch_token else error_detail
                     )
-                    await maybe_send_failure_alert(http_client=http_client, settings=app.state.settings, msg=msg)
+                    error_detail = error_detail[:5_000]
+                    LOGGER.error("Dispatcher triage request failed error=%s", error_detail)
+                    await asyncio.to_thread(
+                        dbm.insert_dispatch_run,
+                        runtime_settings,
+                        state_key="e2e-registry.failure",
+                        bundle=None,
+                        ui_url=None,
+                        queue_state="dispatch_error",
+                        agent_message=None,
+                        error_message=error_detail,
+                        context=dispatch_context,
+                    )
+                    await maybe_send_failure_alert(
+                        http_client=http_client,
+                        settings=runtime_settings,
+                        msg=(
+                            "Dispatcher triage unavailable state=dispatch_error\n"
+                            f"Error: {error_detail[:500]}"
+                        ),
+                    )
+
+        if outcome.recovered_up and outcome.updated and outcome.test_id and outcome.test_name:
+            cfg = await asyncio.to_thread(
+                dbm.get_test_config_internal, app.state.settings, test_id=outcome.test_id
+            )
+            if isinstance(cfg, dict) and bool(int(cfg.get("notify_on_recovery") or 0)):
+                msg = build_recovery_telegram_message(
+                    settings=app.state.settings,
+                    test_id=outcome.test_id,
+                    test_name=outcome.test_name,
+                    run_id=run_id,
+                )
+                await maybe_send_failure_alert(http_client=http_client, settings=app.state.settings, msg=msg)
 
         return {"ok": True, "outcome": outcome.__dict__}
 
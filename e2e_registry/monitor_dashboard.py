@@ -52,14 +52,33 @@ def _downsample(items: list[Any], *, max_points: int) -> list[Any]:
     return out
 
 
+# libyaml's C loader when PyYAML was built with it, same safe semantics as yaml.safe_load.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML per path with the (mtime_ns, size) it was parsed at. The dashboard reloads whenever the
+# monitor rewrites state.json (every cycle); the config rarely changes, so it is only re-parsed when its
+# file does. Callers treat the returned mapping as read-only (MonitorData is already shared across requests).
+_YAML_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+
 def _load_yaml(path: Path) -> dict[str, Any]:
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        st = path.stat()
+    except OSError:
+        return {}
+    cached = _YAML_CACHE.get(str(path))
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    try:
+        # _YAML_SAFE_LOADER is always CSafeLoader or SafeLoader; ruff cannot resolve it through getattr.
+        data = yaml.load(path.read_bytes(), Loader=_YAML_SAFE_LOADER) or {}  # noqa: S506
     except FileNotFoundError:
         return {}
     except Exception:
         return {}
-    return data if isinstance(data, dict) else {}
+    result = data if isinstance(data, dict) else {}
+    _YAML_CACHE[str(path)] = (st.st_mtime_ns, st.st_size, result)
+    return result
 
 
 def _load_json(path: Path) -> dict[str, Any]:
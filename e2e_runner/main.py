@@ -16,7 +16,7 @@ from typing import Any
 import httpx
 from playwright.async_api import Browser, async_playwright
 
-from domain_checks.common_check import find_chromium_executable
+from domain_checks.common_check import find_chromium_executable, make_http_client
 from domain_checks.metrics_synthetic import run_synthetic_transactions
 
 
@@ -506,7 +506,7 @@ async def run_loop(cfg: RunnerConfig) -> int:
         cfg.code_exec_mode,
     )
 
-    async with httpx.AsyncClient(headers={"User-Agent": "PitchAI E2E Runner"}) as client:
+    async with make_http_client(user_agent="PitchAI E2E Runner") as client:
         async with async_playwright() as p:
             browser: Browser | None = None
             launch_fail_count = 0
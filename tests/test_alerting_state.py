@@ -3,7 +3,10 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from domain_checks.main import _load_monitor_state, _update_effective_ok
+import pytest
+
+from domain_checks import main as main_mod
+from domain_checks.main import _dump_state_bytes, _load_monitor_state, _update_effective_ok, _write_state_atomic
 
 
 def test_update_effective_ok_debounces_down_and_up() -> None:
@@ -76,3 +79,19 @@ def test_load_monitor_state_back_compat_last_ok_only(tmp_path: Path) -> None:
     assert state["fail_streak"] == {}
     assert state["success_streak"] == {}
 
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_state_file_round_trips_with_either_json_backend(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, backend: str
+) -> None:
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(main_mod, "orjson", None)
+    p = tmp_path / "state.json"
+    _write_state_atomic(p, {"last_ok": {"b.example": False, "ä.example": True}, "fail_streak": {"b.example": 2}})
+    state = _load_monitor_state(p)
+    assert state["last_ok"] == {"b.example": False, "ä.example": True}
+    assert state["fail_streak"] == {"b.example": 2}
+    # Non-string keys are stringified by both backends, as stdlib json always did.
+    assert json.loads(_dump_state_bytes({"n": {1: 0.5}})) == {"n": {"1": 0.5}}
@@ -6,7 +6,7 @@ import httpx
 import pytest
 
 import domain_checks.main as monitor
-from domain_checks.common_check import DomainCheckSpec
+from domain_checks.common_check import BrowserContextPool, DomainCheckSpec
 
 
 @pytest.mark.asyncio
@@ -30,3 +30,80 @@ async def test_check_one_domain_browser_unavailable_is_degraded(monkeypatch: pyt
     assert result.details.get("error") == "browser_unavailable"
     assert result.details.get("browser_infra_error") is True
 
+
+class _FakeContext:
+    def __init__(self, *, route_error: bool = False) -> None:
+        self.closed = False
+        self.cookies_cleared = 0
+        self.origins: list[dict[str, object]] = []
+        self.route_error = route_error
+
+    async def route(self, *_args, **_kwargs) -> None:
+        if self.route_error:
+            raise RuntimeError("route registration failed")
+
+    async def clear_cookies(self) -> None:
+        self.cookies_cleared += 1
+
+    async def storage_state(self) -> dict[str, object]:
+        return {"cookies": [], "origins": self.origins}
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self, *, route_error: bool = False) -> None:
+        self.created: list[_FakeContext] = []
+        self.context_kwargs: list[dict[str, object]] = []
+        self.route_error = route_error
+
+    async def new_context(self, **kwargs) -> _FakeContext:
+        ctx = _FakeContext(route_error=self.route_error)
+        self.created.append(ctx)
+        self.context_kwargs.append(kwargs)
+        return ctx
+
+
+@pytest.mark.asyncio
+async def test_browser_context_pool_reuses_and_recycles_contexts() -> None:
+    pool = BrowserContextPool(size=1, max_uses=2)
+    browser = _FakeBrowser()
+
+    first = await pool.acquire(browser)
+    await pool.release(first, reusable=True)
+    assert await pool.acquire(browser) is first
+    assert first.cookies_cleared == 1
+
+    # Second use reaches max_uses: the context is closed instead of pooled.
+    await pool.release(first, reusable=True)
+    assert first.closed is True
+
+    failed = await pool.acquire(browser)
+    assert failed is not first
+    await pool.release(failed, reusable=False)
+    assert failed.closed is True
+
+    # A relaunched browser never receives contexts from the old one.
+    kept = await pool.acquire(browser)
+    await pool.release(kept, reusable=True)
+    relaunched = _FakeBrowser()
+    fresh = await pool.acquire(relaunched)
+    assert fresh is relaunched.created[0]
+    assert kept.closed is True
+
+    # Contexts block service workers, and one still holding web storage is recycled rather than pooled.
+    assert relaunched.context_kwargs[0]["service_workers"] == "block"
+    fresh.origins = [{"origin": "https://example.com", "localStorage": [{"name": "k", "value": "v"}]}]
+    await pool.release(fresh, reusable=True)
+    assert fresh.closed is True
+
+
+@pytest.mark.asyncio
+async def test_browser_context_pool_closes_context_when_route_registration_fails() -> None:
+    pool = BrowserContextPool(size=1)
+    browser = _FakeBrowser(route_error=True)
+
+    with pytest.raises(RuntimeError):
+        await pool.acquire(browser)
+    assert browser.created[0].closed is True
@@ -72,3 +72,11 @@ def test_afasask_demo_canary_fails_fast_on_explicit_data_failure() -> None:
     assert '"afasask_demo_canary_fail"' in source
     assert "state.failureMarkers.some" in source
     assert "for marker in _FAILURE_MARKERS" in source
+
+
+def test_load_domain_spec_reuses_compiled_plugin_spec() -> None:
+    config_path = Path(__file__).resolve().parents[1] / "domain_checks" / "config.yaml"
+    domains = load_config(config_path).get("domains")
+    entry = next(d for d in domains if isinstance(d, dict) and d.get("domain") == "afasask.pitchai.net")
+
+    assert load_domain_spec(entry) is load_domain_spec(entry)
@@ -13,6 +13,7 @@ from domain_checks.dispatch_client import (
     dispatch_endpoint_unavailable_reason,
     dispatch_job,
     get_last_agent_message,
+    get_run_log_tail,
     parse_dispatch_response,
     wait_for_terminal_status,
 )
@@ -224,3 +225,28 @@ async def test_dispatch_polling_tolerates_transient_502(flaky_dispatcher_base_ur
         bundle, _runner = await dispatch_job(client, cfg, prompt="hi", config_toml="approval_policy='never'")
         status = await wait_for_terminal_status(client, cfg, bundle=bundle)
         assert status["queue_state"] == "processed"
+
+
+@pytest.mark.asyncio
+async def test_log_tail_reuses_known_size_and_follows_growth() -> None:
+    log = {"text": "line\n" * 100}
+    calls: list[tuple[int, int]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        max_bytes = int(request.url.params["max_bytes"])
+        calls.append((offset, max_bytes))
+        raw = log["text"].encode("utf-8")
+        chunk = raw[offset : offset + max_bytes]
+        return httpx.Response(200, json={"exists": True, "size": len(raw), "content": chunk.decode("utf-8")})
+
+    cfg = DispatchConfig(base_url="http://dispatcher.test", token="token", log_tail_bytes=50)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        assert await get_run_log_tail(client, cfg, bundle="size-cache") == log["text"][-50:]
+        assert await get_run_log_tail(client, cfg, bundle="size-cache") == log["text"][-50:]
+        assert calls == [(0, 1), (450, 50), (450, 50)]
+
+        log["text"] += "more\n"
+        calls.clear()
+        assert await get_run_log_tail(client, cfg, bundle="size-cache") == log["text"][-50:]
+        assert calls == [(450, 50), (455, 50)]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import socketserver
+import threading
 from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
 
 import pytest
 
 from domain_checks.common_check import DomainCheckResult, DomainCheckSpec
-from domain_checks.docker_unix import DockerUnixResponse
+from domain_checks.docker_unix import DockerUnixResponse, docker_unix_get_json
 from domain_checks.metrics_container_health import check_container_health
 from domain_checks.metrics_dns import check_dns
 from domain_checks.metrics_nginx import compute_access_window_stats, parse_recent_upstream_errors, summarize_upstream_errors
@@ -202,3 +206,40 @@ def test_nginx_access_and_error_log_parsers(tmp_path) -> None:
     assert events and events[0].server == "svc.example"
     summary = summarize_upstream_errors(events)
     assert summary["counts_by_server"]["svc.example"] == 1
+
+
+def test_docker_unix_get_json_reuses_keep_alive_connection(tmp_path: Path) -> None:
+    connections: list[int] = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            connections.append(1)
+            super().setup()
+
+        def log_message(self, format: str, *args) -> None:  # noqa: A002
+            return
+
+        def do_GET(self) -> None:  # noqa: N802
+            body = b'{"Id": "abc"}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    socket_path = str(tmp_path / "docker.sock")
+    server = socketserver.ThreadingUnixStreamServer(socket_path, _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        for _ in range(3):
+            res = docker_unix_get_json(socket_path=socket_path, path="/containers/abc/json", timeout_seconds=2.0)
+            assert res.ok and res.data == {"Id": "abc"}
+        assert len(connections) == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
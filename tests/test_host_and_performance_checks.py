@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import pytest
+
+from domain_checks import main as main_mod
 from domain_checks.common_check import DomainCheckResult
 from domain_checks.main import (
     _collect_host_health_violations,
     _collect_performance_violations,
     _compute_cpu_used_percent,
+    _parse_hhmm,
+    _read_linux_meminfo_kb,
+    _read_linux_proc_stat_cpu_total_idle,
+    _worst_disk,
 )
 
 
@@ -18,6 +25,44 @@ def test_compute_cpu_used_percent_zero_or_negative_delta_returns_none() -> None:
     assert _compute_cpu_used_percent(prev_total=200, prev_idle=10, cur_total=100, cur_idle=20) is None
 
 
+def test_read_linux_meminfo_kb_extracts_line_anchored_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    raw = (
+        b"MemTotal:        8000000 kB\n"
+        b"MemFree:         1000000 kB\n"
+        b"MemAvailable:    6000000 kB\n"
+        b"CommitSwapFree:        7 kB\n"
+        b"SwapTotal:       2000000 kB\n"
+        b"SwapFree:        1500000 kB"
+    )
+    monkeypatch.setattr(main_mod, "_read_proc_bytes", lambda _path, _max_bytes: raw)
+    assert _read_linux_meminfo_kb() == {
+        "MemTotal": 8000000,
+        "MemAvailable": 6000000,
+        "SwapTotal": 2000000,
+        "SwapFree": 1500000,
+    }
+
+
+def test_read_linux_proc_stat_uses_aggregate_cpu_line(monkeypatch: pytest.MonkeyPatch) -> None:
+    raw = b"cpu  100 5 50 800 40 0 5 0 0 0\ncpu0 100 5 50 800 40 0 5 0 0 0\nintr 1 2 3"
+    monkeypatch.setattr(main_mod, "_read_proc_bytes", lambda _path, _max_bytes: raw)
+    assert _read_linux_proc_stat_cpu_total_idle() == (1000, 840)
+
+    monkeypatch.setattr(main_mod, "_read_proc_bytes", lambda _path, _max_bytes: b"cpu0 1 2 3 4\n")
+    assert _read_linux_proc_stat_cpu_total_idle() is None
+
+
+def test_worst_disk_skips_invalid_entries() -> None:
+    disk = {
+        "/": {"used_percent": 50},
+        "/data": {"used_percent": "91.5"},
+        "/broken": {"used_percent": None},
+        "/bogus": 3,
+    }
+    assert _worst_disk(disk) == ("/data", 91.5)
+    assert _worst_disk({"/": {"used_percent": "n/a"}}) is None
+
+
 def test_collect_host_health_violations_thresholds() -> None:
     snap = {
         "disk": {
@@ -76,3 +121,10 @@ def test_collect_performance_violations_thresholds_and_overrides() -> None:
     assert "a.example" not in domains  # overridden threshold
     assert "b.example" in domains
     assert "down.example" not in domains  # down domains are excluded from perf warnings
+
+
+def test_parse_hhmm_accepts_yaml_base60_and_rejects_small_ints() -> None:
+    assert _parse_hhmm("09:30").hour == 9
+    assert _parse_hhmm(1080).hour == 18  # unquoted 18:00 under YAML 1.1
+    with pytest.raises(ValueError):
+        _parse_hhmm(5)
@@ -9,7 +9,17 @@ import httpx
 import pytest
 from playwright.async_api import async_playwright
 
-from domain_checks.common_check import DomainCheckSpec, SelectorCheck, find_chromium_executable, http_get_check, browser_check
+from domain_checks import common_check
+from domain_checks.common_check import (
+    DomainCheckSpec,
+    SelectorCheck,
+    _html_to_visible_text,
+    browser_check,
+    find_chromium_executable,
+    http_get_check,
+    spec_needs_browser,
+    static_html_check,
+)
 
 
 class _Handler(BaseHTTPRequestHandler):
@@ -195,6 +205,145 @@ async def test_http_get_allows_explicit_status_codes(local_server_base_url: str)
     assert float(details["http_elapsed_ms"]) >= 0
 
 
+@pytest.mark.asyncio
+async def test_http_get_static_html_check_for_attached_only_specs(local_server_base_url: str) -> None:
+    spec_ok = DomainCheckSpec(
+        domain="local",
+        url=f"{local_server_base_url}/ok",
+        http_timeout_seconds=5.0,
+        required_selectors_all=[SelectorCheck(selector="nav", state="attached")],
+        required_text_all=["Everything is fine"],
+    )
+    spec_missing = DomainCheckSpec(
+        domain="local",
+        url=f"{local_server_base_url}/missing_nav",
+        http_timeout_seconds=5.0,
+        required_selectors_all=[SelectorCheck(selector="nav, #nav", state="attached")],
+    )
+    assert spec_needs_browser(spec_ok) is False
+    async with httpx.AsyncClient() as client:
+        ok, details = await http_get_check(spec_ok, client)
+        assert ok is True
+        assert details["static_html_ok"] is True
+
+        ok, details = await http_get_check(spec_missing, client)
+        assert ok is True
+        assert details["static_html_ok"] is False
+        assert details["static_html_details"]["missing_selectors_all"] == ["nav, #nav"]
+
+
+@pytest.mark.asyncio
+async def test_http_get_reads_at_most_max_body_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(common_check, "HTTP_MAX_BODY_BYTES", 64)
+    body = b"<p>fine</p>" + b" " * 200 + b"<p>maintenance</p>"
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    spec = DomainCheckSpec(domain="local", url="http://local.test/")
+    async with httpx.AsyncClient(transport=transport) as client:
+        ok, details = await http_get_check(spec, client)
+    assert ok is True
+    assert details["forbidden_hits"] == []
+    assert details["body_truncated_at_bytes"] == 64
+
+
+@pytest.mark.asyncio
+async def test_http_get_captures_only_allowed_headers() -> None:
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200,
+            headers={"X-Upstream": "127.0.0.1:3121", "Set-Cookie": "session=secret"},
+            content=b"<p>ok</p>",
+        )
+    )
+    spec = DomainCheckSpec(
+        domain="local",
+        url="http://local.test/",
+        capture_headers=["X-Upstream", "Set-Cookie", "bad header!", "x-missing"],
+    )
+    assert spec.capture_header_keys == ("x-upstream", "x-missing")
+    async with httpx.AsyncClient(transport=transport) as client:
+        ok, details = await http_get_check(spec, client)
+    assert ok is True
+    assert details["captured_headers"] == {"x-upstream": "127.0.0.1:3121"}
+
+
+def test_html_to_visible_text_strips_scripts_and_tolerates_unclosed_tags() -> None:
+    html = "<p>Hello</p><SCRIPT type=x>maintenance</script><style>x{}</style><b>World</b><script>never closed"
+    assert _html_to_visible_text(html) == "hello world never closed"
+    assert _html_to_visible_text("<script>" * 5000).strip() == ""
+
+
+def test_spec_needs_browser_for_visible_title_or_complex_selectors() -> None:
+    base = {"domain": "local", "url": "http://127.0.0.1/"}
+    assert spec_needs_browser(DomainCheckSpec(**base)) is True
+    assert spec_needs_browser(DomainCheckSpec(**base, required_selectors_all=[SelectorCheck(selector="nav")])) is True
+    assert spec_needs_browser(
+        DomainCheckSpec(**base, required_selectors_all=[SelectorCheck(selector="main a", state="attached")])
+    ) is True
+    assert spec_needs_browser(
+        DomainCheckSpec(
+            **base,
+            expected_title_contains="OK",
+            required_selectors_all=[SelectorCheck(selector="nav", state="attached")],
+        )
+    ) is True
+    assert spec_needs_browser(
+        DomainCheckSpec(
+            **base,
+            required_selectors_all=[
+                SelectorCheck(selector='a[href="/admin/login/"]', state="attached"),
+                SelectorCheck(selector="script#wss-connection", state="attached"),
+                SelectorCheck(selector="a[href^='/login-admin?next=']", state="attached"),
+            ],
+        )
+    ) is False
+
+
+def test_static_html_check_ignores_markup_inside_noscript() -> None:
+    spec = DomainCheckSpec(
+        domain="local",
+        url="http://127.0.0.1/",
+        required_selectors_all=[SelectorCheck(selector="nav", state="attached")],
+    )
+    ok, details = static_html_check(spec, "<noscript><nav>Enable JS</nav></noscript><main></main>", "")
+    assert ok is False
+    assert details["missing_selectors_all"] == ["nav"]
+    assert static_html_check(spec, "<noscript></noscript><nav></nav>", "")[0] is True
+
+
+
+def test_static_html_check_ignores_inert_content_and_keeps_first_duplicate_attribute() -> None:
+    def spec_for(selector: str) -> DomainCheckSpec:
+        return DomainCheckSpec(
+            domain="local",
+            url="http://127.0.0.1/",
+            required_selectors_all=[SelectorCheck(selector=selector, state="attached")],
+        )
+
+    assert static_html_check(spec_for("#t"), "<template><div id=t></div></template>", "")[0] is False
+    assert static_html_check(spec_for("#in-ta"), "<textarea><b id=in-ta></b></textarea>", "")[0] is False
+    assert static_html_check(spec_for("#in-title"), "<title><i id=in-title></i></title>", "")[0] is False
+    assert static_html_check(spec_for("template#t"), "<template id=t><p></p></template>", "")[0] is True
+    assert static_html_check(spec_for("#after"), "<textarea></textarea><p id=after></p>", "")[0] is True
+    assert static_html_check(spec_for("#second"), '<p id="first" id="second"></p>', "")[0] is False
+    assert static_html_check(spec_for("#first"), '<p id="first" id="second"></p>', "")[0] is True
+
+
+def test_spec_needs_browser_for_ids_and_classes_that_are_not_css_identifiers() -> None:
+    for selector in ("div#1", "#-1a", ".2col"):
+        spec = DomainCheckSpec(
+            domain="local",
+            url="http://127.0.0.1/",
+            required_selectors_all=[SelectorCheck(selector=selector, state="attached")],
+        )
+        assert spec_needs_browser(spec) is True
+    spec = DomainCheckSpec(
+        domain="local",
+        url="http://127.0.0.1/",
+        required_selectors_all=[SelectorCheck(selector="#-a.--b._c", state="attached")],
+    )
+    assert spec_needs_browser(spec) is False
+
+
 @pytest.mark.asyncio
 async def test_browser_check_ok(local_server_base_url: str) -> None:
     chromium_path = find_chromium_executable()
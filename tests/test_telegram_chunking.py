@@ -1,6 +1,18 @@
 from __future__ import annotations
 
-from domain_checks.telegram import TELEGRAM_MAX_MESSAGE_LEN, split_telegram_message
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from domain_checks import telegram
+from domain_checks.telegram import (
+    TELEGRAM_MAX_MESSAGE_LEN,
+    TelegramConfig,
+    TokenBucket,
+    send_telegram_message,
+    split_telegram_message,
+)
 
 
 def test_split_telegram_message_respects_max_len() -> None:
@@ -17,3 +29,55 @@ def test_split_telegram_message_default_limit() -> None:
     assert len(parts[0]) <= TELEGRAM_MAX_MESSAGE_LEN
     assert len(parts[1]) <= TELEGRAM_MAX_MESSAGE_LEN
 
+
+def test_token_bucket_allows_burst_then_queues(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(telegram, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    bucket = TokenBucket(rate=0.5, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == 2.0
+    assert bucket.reserve() == 4.0  # queued behind the previous reservation, never dropped
+    clock[0] += 4.0
+    assert bucket.reserve() == 2.0
+
+
+@pytest.mark.asyncio
+async def test_send_telegram_message_waits_for_a_slot_instead_of_dropping(monkeypatch: pytest.MonkeyPatch) -> None:
+    bucket = TokenBucket(rate=1 / 3, burst=1)
+    bucket.reserve()
+    monkeypatch.setitem(telegram._CHAT_BUCKETS, ("queued-test", 20.0), bucket)
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(telegram, "asyncio", SimpleNamespace(sleep=fake_sleep))
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(200, json={"ok": True})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        ok, _data = await send_telegram_message(client, TelegramConfig(bot_token="t", chat_id="queued-test"), "hi")
+    assert ok is True
+    assert calls == [1]
+    assert len(sleeps) == 1
+    assert 2.5 < sleeps[0] <= 3.0
+
+
+@pytest.mark.asyncio
+async def test_send_telegram_message_retries_once_after_flood_control() -> None:
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) == 1:
+            return httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 0.01}})
+        return httpx.Response(200, json={"ok": True, "result": {"message_id": 7}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        ok, data = await send_telegram_message(client, TelegramConfig(bot_token="t", chat_id="flood-test"), "hi")
+    assert ok is True
+    assert data["result"]["message_id"] == 7
+    assert len(calls) == 2